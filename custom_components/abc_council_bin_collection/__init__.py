@@ -1,15 +1,50 @@
 import logging
+import voluptuous as vol
 
-from .const import DOMAIN, DEFAULT_UPDATE_INTERVAL
+from .const import DOMAIN, DEFAULT_IMPORT_STAGGER_WINDOW, DEFAULT_UPDATE_INTERVAL, INITIAL_DATA
 from .coordinator import BinCollectionDataUpdateCoordinator
-from datetime import timedelta
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from datetime import datetime, timedelta
+from homeassistant.config_entries import ConfigEntry, SOURCE_IMPORT
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.typing import ConfigType
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = ["sensor", "button"]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+SERVICE_IMPORT_ADDRESSES = "import_addresses"
+IMPORT_ADDRESSES_SCHEMA = vol.Schema({
+    vol.Required("addresses"): vol.All(cv.ensure_list_csv, [cv.string]),
+    vol.Optional("stagger_window", default=DEFAULT_IMPORT_STAGGER_WINDOW): vol.All(vol.Coerce(int), vol.Range(min=0)),
+})
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Register integration wide services"""
+
+    async def _async_import_addresses(call: ServiceCall) -> None:
+        """Create a config entry per address, spreading first fetches over the stagger window"""
+
+        addresses = call.data["addresses"]
+        stagger_window = call.data["stagger_window"]
+        step = stagger_window / len(addresses) if addresses else 0
+
+        _LOGGER.info("Importing %d addresses over a %s second window", len(addresses), stagger_window)
+
+        for index, address in enumerate(addresses):
+            await hass.config_entries.flow.async_init(
+                DOMAIN,
+                context={"source": SOURCE_IMPORT},
+                data={"user_address": address, "first_fetch_delay": index * step},
+            )
+
+    hass.services.async_register(DOMAIN, SERVICE_IMPORT_ADDRESSES, _async_import_addresses, schema=IMPORT_ADDRESSES_SCHEMA)
+
+    return True
+
 def _extract_options(entry: ConfigEntry) -> tuple[str, timedelta, dict]:
     """Extract and validate options from the config entry"""
 
@@ -37,6 +72,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.error("Missing address in entry data - reinstall integration.")
         return False
 
+    # Only set for entries created by the bulk import service, dropped so it applies to the first setup only
+    first_fetch_delay = entry.data.get("first_fetch_delay", 0)
+    if "first_fetch_delay" in entry.data:
+        hass.config_entries.async_update_entry(
+            entry, data={key: value for key, value in entry.data.items() if key != "first_fetch_delay"}
+        )
+    # Only set for entries just created by the user step, which already fetched the address
+    initial_data = hass.data.get(INITIAL_DATA, {}).pop(address, None)
+
     _LOGGER.debug("Setting up integration with address: %s, update_interval: %s, options: %s", address, update_interval, entry.options)
 
     try:
@@ -50,11 +94,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             event_summaries=event_summaries,
         )
         await coordinator.load_stored_events()
-        coordinator.data = await coordinator._async_update_data()
+        if initial_data:
+            _LOGGER.debug("Using data fetched during config flow for address: %s", address)
+            coordinator.data = initial_data
+        elif not first_fetch_delay:
+            coordinator.data = await coordinator._async_update_data()
     except Exception as err:
         _LOGGER.exception("Error setting up coordinator: %s", err)
         return False
 
+    if first_fetch_delay:
+        _LOGGER.info("Delaying first fetch for address %s by %.0f seconds", address, first_fetch_delay)
+        coordinator.data = {}
+
+        async def _async_first_refresh(_now: datetime) -> None:
+            await coordinator.async_refresh()
+
+        entry.async_on_unload(async_call_later(hass, first_fetch_delay, _async_first_refresh))
+
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -9,6 +9,7 @@ import logging
 from .const import DOMAIN, DEVICE_NAME, DEVICE_MANUFACTURER, DEVICE_MODEL
 from .storage import BinCollectionStorage
 from homeassistant.components.button import ButtonEntity
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
@@ -24,6 +25,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         _LOGGER.error("Coordinator not found for entry_id: %s", entry.entry_id)
         return
 
+    # Aggregate mode keeps the entity count down, the button is only useful with calendar events
+    if entry.options.get("aggregate_mode", False) and not coordinator.create_calendar_events:
+        _LOGGER.debug("Aggregate mode without calendar events, skipping Clear Bin Events button.")
+
+        # Remove the button left in the registry from before aggregate mode was enabled
+        registry = er.async_get(hass)
+        entity_id = registry.async_get_entity_id("button", DOMAIN, f"clear_bin_events_{entry.entry_id}")
+        if entity_id:
+            registry.async_remove(entity_id)
+        return
+
     async_add_entities([ClearBinEventsButton(coordinator.storage, entry.entry_id, coordinator.address)])
     _LOGGER.debug("Clear Bin Events button entity successfully registered.")
 
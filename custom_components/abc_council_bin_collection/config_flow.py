@@ -1,18 +1,23 @@
 """
 Config flow for the ABC Council Bin Collection integration.
 
-Handles the user input for setting up the integration, including sanitation 
-and validation of the address. Also provides an options flow for changing
-data interval along with enabling/disabling calendar event creation feature.
+Handles the user input for setting up the integration, including sanitation
+and validation of the address against the council website. Also
+provides an options flow for changing data interval along with
+enabling/disabling calendar event creation feature.
+Bulk imported addresses arrive through the import step.
 """
 import logging
 import voluptuous as vol
 
-from .const import DOMAIN, DEFAULT_UPDATE_INTERVAL, MIN_UPDATE_INTERVAL
-from typing import Any, Dict, Optional
+from .const import DOMAIN, DEFAULT_AGGREGATE_GROUP, DEFAULT_UPDATE_INTERVAL, INITIAL_DATA, MIN_UPDATE_INTERVAL
+from .coordinator import BIN_DAY_URL, async_fetch_html
+from .parser import async_get_parser
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse, parse_qs
 from homeassistant import config_entries
 from homeassistant.core import callback
+from homeassistant.util import slugify
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -43,18 +48,87 @@ class BinCollectionConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = "invalid_address"
                 _LOGGER.error("Invalid address input: %s", address_input)
             else:
-                _LOGGER.debug("Creating entry with sanitized address: %s", sanitized_address)
-                return self.async_create_entry(
-                    title="ABC Council Bin Collection",
-                    data={"address": sanitized_address},
-                    options={}  # Ensure options are initialized.
-                )
+                errors, data = await self._async_validate_address(sanitized_address)
+                if not errors:
+                    return self._async_create_address_entry(sanitized_address, data)
 
         data_schema = vol.Schema({vol.Required("user_address"): str})
         return self.async_show_form(
             step_id="user", data_schema=data_schema, errors=errors
         )
 
+    async def _async_validate_address(self, address: str) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+        """
+        Fetch and parse the address once to check it has bin collections.
+
+        Returns:
+            Any form errors, and the parsed data to hand to the new entry's coordinator.
+        """
+
+        errors: Dict[str, str] = {}
+        data: Dict[str, List[str]] = {}
+
+        try:
+            html = await async_fetch_html(self.hass, BIN_DAY_URL.format(address=address))
+            data = await async_get_parser(self.hass).async_parse(html)
+        except Exception as err:
+            errors["base"] = "cannot_connect"
+            _LOGGER.error("Error fetching data for address %s: %s", address, err)
+        else:
+            if not data:
+                errors["base"] = "no_bin_sections"
+                _LOGGER.error("No bin collections found for address: %s", address)
+
+        return errors, data
+
+    @callback
+    def _async_create_address_entry(self, address: str, data: Dict[str, List[str]]) -> Dict[str, Any]:
+        """
+        Create the entry, handing the data fetched during validation to async_setup_entry
+        so the first refresh doesn't need a second network round trip.
+        """
+
+        self.hass.data.setdefault(INITIAL_DATA, {})[address] = data
+
+        _LOGGER.debug("Creating entry with sanitized address: %s", address)
+        return self.async_create_entry(
+            title="ABC Council Bin Collection",
+            data={"address": address},
+            options={}  # Ensure options are initialized.
+        )
+
+    async def async_step_import(self, import_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle an address provided by the bulk import service.
+
+        The address is sanitized and validated the same way as the address step, but is not
+        fetched here so a large import doesn't hit the council website all at once. An optional
+        first_fetch_delay (in seconds) is stored in the entry data so async_setup_entry can
+        stagger the initial fetch of each imported entry.
+        """
+
+        address_input = import_data.get("user_address", "")
+        sanitized_address = self._sanitize_address(address_input)
+
+        if not sanitized_address or not sanitized_address.isdigit():
+            _LOGGER.error("Invalid address input in import: %s", address_input)
+            return self.async_abort(reason="invalid_address")
+
+        self._async_abort_entries_match({"address": sanitized_address})
+
+        data: Dict[str, Any] = {"address": sanitized_address}
+        first_fetch_delay = import_data.get("first_fetch_delay", 0)
+        if first_fetch_delay:
+            # Dropped from the entry by async_setup_entry once the first fetch is scheduled
+            data["first_fetch_delay"] = first_fetch_delay
+
+        _LOGGER.debug("Creating imported entry with sanitized address: %s", sanitized_address)
+        return self.async_create_entry(
+            title="ABC Council Bin Collection",
+            data=data,
+            options={}  # Ensure options are initialized.
+        )
+
     def _sanitize_address(self, address_input: str) -> str:
         """
         Extract and sanitize the numeric address if a full URL is provided.
@@ -107,6 +181,10 @@ class BinCollectionOptionsFlowHandler(config_entries.OptionsFlow):
                     value = f"calendar.{value}"
                 user_input["calendar_entity"] = value
 
+            # Normalize the aggregate group once, it is used as the aggregate sensor's key and unique ID.
+            if "aggregate_group" in user_input:
+                user_input["aggregate_group"] = slugify(user_input["aggregate_group"]) or DEFAULT_AGGREGATE_GROUP
+
             _LOGGER.debug("User options received: %s", user_input)
             result = self.async_create_entry(title="", data=user_input)
 
@@ -148,4 +226,12 @@ class BinCollectionOptionsFlowHandler(config_entries.OptionsFlow):
                 "summary_garden_food",
                 default=self._config_entry.options.get("summary_garden_food", "Garden/Food Collections"),
             ): str,
+            vol.Required(
+                "aggregate_mode",
+                default=self._config_entry.options.get("aggregate_mode", False),
+            ): bool,
+            vol.Optional(
+                "aggregate_group",
+                default=self._config_entry.options.get("aggregate_group", DEFAULT_AGGREGATE_GROUP),
+            ): str,
         })
\ No newline at end of file
@@ -30,6 +30,13 @@ DEFAULT_UPDATE_INTERVAL: int = 96  # hours
 #   Minimum allowed number of hours for an update interval to prevent excessive updates
 MIN_UPDATE_INTERVAL: int = 6  # hours
 
+# ---------------------------------------------------------------------------
+# Request Constants
+# ---------------------------------------------------------------------------
+# REQUEST_TIMEOUT:
+#   Maximum time (in seconds) to wait for the council website to return a page
+REQUEST_TIMEOUT: int = 20  # seconds
+
 # ---------------------------------------------------------------------------
 # Event Creation Constants
 # ---------------------------------------------------------------------------
@@ -41,6 +48,36 @@ EVENT_CREATION_DELAY: int = 20  # seconds
 #   Delay (in seconds) between each calendar event creation
 EVENT_CREATION_TIMEOUT = 1 # seconds
 
+# ---------------------------------------------------------------------------
+# HTML Parsing Constants
+# ---------------------------------------------------------------------------
+# PARSE_EXECUTOR_WORKERS:
+#   Number of threads in the dedicated pool used for parsing bin day pages
+PARSE_EXECUTOR_WORKERS: int = 2
+
+# PARSE_BATCH_SIZE:
+#   Maximum number of pages parsed together in a single executor job
+PARSE_BATCH_SIZE: int = 10
+
+# PARSE_BATCH_DELAY:
+#   Delay (in seconds) to wait for further pages before a batch is parsed
+PARSE_BATCH_DELAY: float = 0.5  # seconds
+
+# PARSER:
+#   hass.data key holding the domain wide BinCollectionParser
+PARSER: str = f"{DOMAIN}_parser"
+
+# ---------------------------------------------------------------------------
+# Bulk Import Constants
+# ---------------------------------------------------------------------------
+# DEFAULT_IMPORT_STAGGER_WINDOW:
+#   Window (in seconds) over which the first fetch of bulk imported addresses is spread
+DEFAULT_IMPORT_STAGGER_WINDOW: int = 300  # seconds
+
+# INITIAL_DATA:
+#   hass.data key holding data fetched during the config flow, keyed by address, used as the first refresh
+INITIAL_DATA: str = f"{DOMAIN}_initial_data"
+
 # ---------------------------------------------------------------------------
 # Sensor and Event Storage Constants
 # ---------------------------------------------------------------------------
@@ -52,6 +89,15 @@ DEFAULT_SENSOR_NAMES: list[str] = [
     "Garden/Food Collections"
 ]
 
+# DEFAULT_AGGREGATE_GROUP:
+#   Group used by aggregate mode when none is given - entries sharing a group share one sensor.
+#   Groups are stored slugified so names differing only in case or punctuation are the same group.
+DEFAULT_AGGREGATE_GROUP: str = "all_addresses"
+
+# AGGREGATE_SENSORS:
+#   hass.data key holding the aggregate sensor for each group
+AGGREGATE_SENSORS: str = f"{DOMAIN}_aggregate_sensors"
+
 # EVENT_CLEANUP_THRESHOLD_DAYS:
 #   Number of days after which stored events are considered outdated and subject to cleanup.
 EVENT_CLEANUP_THRESHOLD_DAYS: int = 14  # days
\ No newline at end of file
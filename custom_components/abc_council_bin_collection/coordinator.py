@@ -2,25 +2,37 @@ from __future__ import annotations
 
 import logging
 import asyncio
-import async_timeout
 
-from .const import EVENT_CREATION_DELAY, EVENT_CREATION_TIMEOUT
+from .const import EVENT_CREATION_DELAY, EVENT_CREATION_TIMEOUT, REQUEST_TIMEOUT
+from .parser import async_get_parser
 from .storage import BinCollectionStorage
 from datetime import datetime, timedelta
 from typing import Any, Dict, List
-from bs4 import BeautifulSoup
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
-# Define types for clarity.
-BIN_TYPES: Dict[str, str] = {
-    "bg-black": "Domestic Collections",
-    "bg-green": "Recycling Collections",
-    "bg-brown": "Garden/Food Collections",
-}
+BIN_DAY_URL: str = "https://www.armaghbanbridgecraigavon.gov.uk/resident/binday-result/?address={address}"
+
+async def async_fetch_html(hass: HomeAssistant, url: str) -> str:
+    """
+    Fetch the bin day page once, raising on timeout or HTTP error.
+
+    Args:
+        hass: Home Assistant instance.
+        url: The binday-result URL for an address.
+
+    Returns:
+        The HTML content as a string.
+    """
+
+    async with asyncio.timeout(REQUEST_TIMEOUT):
+        session = async_get_clientsession(hass)
+        response = await session.get(url)
+        response.raise_for_status()
+        return await response.text()
 
 class BinCollectionDataUpdateCoordinator(DataUpdateCoordinator):
     """
@@ -57,7 +69,7 @@ class BinCollectionDataUpdateCoordinator(DataUpdateCoordinator):
         """
         self.hass = hass
         self.address = address
-        self.url = f"https://www.armaghbanbridgecraigavon.gov.uk/resident/binday-result/?address={self.address}"
+        self.url = BIN_DAY_URL.format(address=self.address)
         self.create_calendar_events = create_calendar_events
         self.calendar_entity = calendar_entity
         self.event_summaries = event_summaries
@@ -87,11 +99,7 @@ class BinCollectionDataUpdateCoordinator(DataUpdateCoordinator):
         # Tries 3 times before failure
         for attempt in range(3):
             try:
-                async with async_timeout.timeout(EVENT_CREATION_DELAY):
-                    session = async_get_clientsession(self.hass)
-                    response = await session.get(self.url)
-                    response.raise_for_status()
-                    html = await response.text()
+                html = await async_fetch_html(self.hass, self.url)
                 break
             except Exception as err:
                 _LOGGER.error("Error fetching data (attempt %d): %s", attempt + 1, err)
@@ -99,7 +107,7 @@ class BinCollectionDataUpdateCoordinator(DataUpdateCoordinator):
                     # Returning empty dict ensures we always return a dict
                     return {}
 
-        data = await self.hass.async_add_executor_job(self._parse_html, html)
+        data = await async_get_parser(self.hass).async_parse(html)
 
         # Create calendar events if enabled
         if self.create_calendar_events:
@@ -112,42 +120,6 @@ class BinCollectionDataUpdateCoordinator(DataUpdateCoordinator):
 
         return data if data else {}
 
-    def _parse_html(self, html: str) -> Dict[str, List[str]]:
-        """
-        Parse the HTML content to extract bin collection dates.
-
-        Args:
-            html: The HTML content as a string.
-
-        Returns:
-            A dictionary with keys as bin collection types and values as lists of dates (in ISO format).
-        """
-
-        result: Dict[str, List[str]] = {}
-        soup = BeautifulSoup(html, "html.parser")
-
-        for class_name, default_title in BIN_TYPES.items():
-            target_divs = soup.find_all("div", class_=class_name)
-            dates_list: List[str] = []
-
-            for target_div in target_divs:
-                sibling_div = target_div.find_parent().find_next_sibling("div")
-                if sibling_div:
-                    for h4 in sibling_div.find_all("h4"):
-                        date_text = h4.text.strip()
-                        try:
-                            date_obj = datetime.strptime(date_text, "%d/%m/%Y")
-                            formatted_date = date_obj.strftime("%Y-%m-%d")  # ISO format
-                            dates_list.append(formatted_date)
-                        except ValueError:
-                            _LOGGER.warning("Skipping invalid date format: %s", date_text)
-                else:
-                    _LOGGER.warning("No sibling div found for bin type '%s'.", default_title)
-
-            result[default_title] = dates_list if dates_list else ["No collection scheduled"]
-
-        return result
-
     async def load_stored_events(self) -> None:
         """Load persistent bin collection events into memory"""
         await self.storage.load_data()
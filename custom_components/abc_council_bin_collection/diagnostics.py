@@ -0,0 +1,28 @@
+"""
+Diagnostics support for the ABC Council Bin Collection integration.
+
+Exposes the entry's latest bin collection data along with the domain wide
+HTML parser metrics (queue depth and parse times) in downloadable diagnostics.
+"""
+
+from .const import DOMAIN, PARSER
+from typing import Any, Dict
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+TO_REDACT = {"address"}
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> Dict[str, Any]:
+    """Return diagnostics for a config entry"""
+
+    coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    parser = hass.data.get(PARSER)
+
+    return {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "options": dict(entry.options),
+        "last_update_success": coordinator.last_update_success if coordinator else None,
+        "data": coordinator.data if coordinator else None,
+        "parser_metrics": dict(parser.metrics) if parser else None,
+    }
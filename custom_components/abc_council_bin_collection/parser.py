@@ -0,0 +1,236 @@
+"""
+HTML parsing for the ABC Council Bin Collection integration.
+
+This module extracts bin collection dates from the council's bin day page and
+provides a domain wide BinCollectionParser that batches pending pages from all
+config entries into a single job on a small dedicated thread pool, so a large
+refresh wave doesn't queue dozens of parses on Home Assistant's shared executor.
+"""
+
+import asyncio
+import logging
+import time
+
+from .const import DOMAIN, PARSE_BATCH_DELAY, PARSE_BATCH_SIZE, PARSE_EXECUTOR_WORKERS, PARSER
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+# Define types for clarity.
+BIN_TYPES: Dict[str, str] = {
+    "bg-black": "Domestic Collections",
+    "bg-green": "Recycling Collections",
+    "bg-brown": "Garden/Food Collections",
+}
+
+def parse_bin_html(html: str) -> Dict[str, List[str]]:
+    """
+    Parse the HTML content to extract bin collection dates.
+
+    Args:
+        html: The HTML content as a string.
+
+    Returns:
+        A dictionary with keys as bin collection types and values as lists of dates (in ISO format).
+        Empty if the page has no bin sections at all, e.g. for an unknown address.
+    """
+
+    # Deferred so the HTML parser stack is only loaded on the first parse,
+    # not when Home Assistant imports the integration at startup.
+    from bs4 import BeautifulSoup
+
+    result: Dict[str, List[str]] = {}
+    found_section = False
+    soup = BeautifulSoup(html, "html.parser")
+
+    for class_name, default_title in BIN_TYPES.items():
+        target_divs = soup.find_all("div", class_=class_name)
+        found_section = found_section or bool(target_divs)
+        dates_list: List[str] = []
+
+        for target_div in target_divs:
+            sibling_div = target_div.find_parent().find_next_sibling("div")
+            if sibling_div:
+                for h4 in sibling_div.find_all("h4"):
+                    date_text = h4.text.strip()
+                    try:
+                        date_obj = datetime.strptime(date_text, "%d/%m/%Y")
+                        formatted_date = date_obj.strftime("%Y-%m-%d")  # ISO format
+                        dates_list.append(formatted_date)
+                    except ValueError:
+                        _LOGGER.warning("Skipping invalid date format: %s", date_text)
+            else:
+                _LOGGER.warning("No sibling div found for bin type '%s'.", default_title)
+
+        result[default_title] = dates_list if dates_list else ["No collection scheduled"]
+
+    if not found_section:
+        _LOGGER.warning("No bin collection sections found in page.")
+        return {}
+
+    return result
+
+def _parse_batch(pages: List[str]) -> Tuple[List[Any], float]:
+    """
+    Parse a batch of pages inside the parser executor
+
+    Args:
+        pages: The HTML content of each page.
+
+    Returns:
+        The parsed data (or the raised exception) for each page, and the time taken in seconds.
+    """
+
+    start = time.monotonic()
+    results: List[Any] = []
+
+    for html in pages:
+        try:
+            results.append(parse_bin_html(html))
+        except Exception as err:
+            results.append(err)
+
+    return results, time.monotonic() - start
+
+class BinCollectionParser:
+    """Batches pending bin day pages and parses them on a dedicated bounded executor"""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the parser and its executor"""
+
+        self.hass = hass
+        self._executor = ThreadPoolExecutor(max_workers=PARSE_EXECUTOR_WORKERS, thread_name_prefix=DOMAIN)
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._in_flight: Dict[asyncio.Task, List[Tuple[str, asyncio.Future]]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+        # queue_depth counts pages waiting for or currently being parsed
+        self.metrics: Dict[str, Any] = {
+            "queue_depth": 0,
+            "max_queue_depth": 0,
+            "batches": 0,
+            "pages_parsed": 0,
+            "last_batch_size": 0,
+            "last_parse_seconds": 0.0,
+            "total_parse_seconds": 0.0,
+        }
+
+    async def async_parse(self, html: str) -> Dict[str, List[str]]:
+        """
+        Queue a page for parsing and wait for its result
+
+        Pages are collected for up to PARSE_BATCH_DELAY seconds, or until PARSE_BATCH_SIZE
+        pages are pending, then parsed together in one executor job.
+
+        Args:
+            html: The HTML content as a string.
+
+        Returns:
+            The parsed data, as returned by parse_bin_html.
+        """
+
+        future: asyncio.Future = self.hass.loop.create_future()
+        self._pending.append((html, future))
+
+        self.metrics["queue_depth"] += 1
+        self.metrics["max_queue_depth"] = max(self.metrics["max_queue_depth"], self.metrics["queue_depth"])
+
+        if len(self._pending) >= PARSE_BATCH_SIZE:
+            self._async_flush()
+        elif self._flush_handle is None:
+            self._flush_handle = self.hass.loop.call_later(PARSE_BATCH_DELAY, self._async_flush)
+
+        return await future
+
+    @callback
+    def _async_flush(self) -> None:
+        """Hand all pending pages to the executor as one batch"""
+
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = self.hass.async_create_task(self._async_run_batch(batch))
+            self._in_flight[task] = batch
+            task.add_done_callback(lambda done: self._in_flight.pop(done, None))
+
+    async def _async_run_batch(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        """Parse a batch in the executor and resolve each waiting caller"""
+
+        try:
+            try:
+                results, elapsed = await self.hass.loop.run_in_executor(
+                    self._executor, _parse_batch, [html for html, _ in batch]
+                )
+            except Exception as err:
+                _LOGGER.error("Error parsing batch of %d pages: %s", len(batch), err)
+                results, elapsed = [err] * len(batch), 0.0
+
+            self.metrics["batches"] += 1
+            self.metrics["pages_parsed"] += len(batch)
+            self.metrics["last_batch_size"] = len(batch)
+            self.metrics["last_parse_seconds"] = elapsed
+            self.metrics["total_parse_seconds"] += elapsed
+            _LOGGER.debug("Parsed batch of %d pages in %.3f seconds, metrics: %s", len(batch), elapsed, self.metrics)
+
+            for (_, future), result in zip(batch, results):
+                # The caller may have been cancelled while waiting
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+        finally:
+            # Also reached when the batch is cancelled by shutdown, so no caller waits forever
+            self.metrics["queue_depth"] -= len(batch)
+            for _, future in batch:
+                if not future.done():
+                    future.cancel()
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending and in-flight batches, then shut down the executor"""
+
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        # A batch task cancelled before it starts never reaches its finally, so its callers are cancelled here
+        in_flight = list(self._in_flight.items())
+        for task, batch in in_flight:
+            task.cancel()
+            for _, future in batch:
+                future.cancel()
+        for _, future in self._pending:
+            future.cancel()
+        self._pending = []
+
+        if in_flight:
+            await asyncio.gather(*(task for task, _ in in_flight), return_exceptions=True)
+        self.metrics["queue_depth"] = 0
+
+        # Joins the worker threads, waiting only for a parse that is already running
+        await self.hass.async_add_executor_job(partial(self._executor.shutdown, wait=True, cancel_futures=True))
+
+@callback
+def async_get_parser(hass: HomeAssistant) -> BinCollectionParser:
+    """Return the domain wide parser, creating it on first use"""
+
+    parser: Optional[BinCollectionParser] = hass.data.get(PARSER)
+    if parser is None:
+        parser = hass.data[PARSER] = BinCollectionParser(hass)
+
+        async def _async_shutdown(_event: Event) -> None:
+            hass.data.pop(PARSER, None)
+            await parser.async_shutdown()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_shutdown)
+
+    return parser
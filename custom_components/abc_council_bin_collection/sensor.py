@@ -3,16 +3,20 @@ Sensor platform for the ABC Council Bin Collection integration.
 
 This module defines sensor entities that report the next bin collection date 
 for a specific bin type. The data is provided by a DataUpdateCoordinator.
+
+In aggregate mode, entries sharing an aggregate group instead feed a single
+sensor holding the next collection date of each bin type for every address.
 """
 
 import logging
 
-from .const import DOMAIN, DEFAULT_SENSOR_NAMES, DEVICE_NAME, DEVICE_MANUFACTURER, DEVICE_MODEL
+from .const import AGGREGATE_SENSORS, DOMAIN, DEFAULT_AGGREGATE_GROUP, DEFAULT_SENSOR_NAMES, DEVICE_NAME, DEVICE_MANUFACTURER, DEVICE_MODEL
 from .coordinator import BinCollectionDataUpdateCoordinator
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.util import slugify
 
 _LOGGER = logging.getLogger(__name__)
@@ -21,6 +25,29 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
     """Setup sensor entities platform"""
 
     coordinator: BinCollectionDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+
+    group = _aggregate_group(config_entry)
+    if group is not None:
+        _async_remove_stale_entities(hass, config_entry, {_aggregate_unique_id(group)})
+
+        aggregate_sensors: Dict[str, BinCollectionAggregateSensor] = hass.data.setdefault(AGGREGATE_SENSORS, {})
+
+        aggregate_sensor = aggregate_sensors.get(group)
+        if aggregate_sensor is None:
+            aggregate_sensor = aggregate_sensors[group] = BinCollectionAggregateSensor(group, config_entry.entry_id)
+            aggregate_sensor.add_member(config_entry.entry_id, coordinator, async_add_entities)
+            async_add_entities([aggregate_sensor])
+        else:
+            aggregate_sensor.add_member(config_entry.entry_id, coordinator, async_add_entities)
+
+        config_entry.async_on_unload(lambda: _async_remove_aggregate_member(hass, group, config_entry))
+        _LOGGER.debug("Address %s added to aggregate group '%s'", coordinator.address, group)
+        return
+
+    _async_remove_stale_entities(
+        hass, config_entry, {_sensor_unique_id(coordinator.address, sensor_name) for sensor_name in DEFAULT_SENSOR_NAMES}
+    )
+
     sensors: List[BinCollectionSensor] = []
     
     # Create a sensor for each default sensor name
@@ -30,6 +57,39 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
     async_add_entities(sensors, update_before_add=True)
     _LOGGER.debug("Sensors for ABC Council Bin Collection successfully registered")
 
+def _aggregate_group(config_entry: ConfigEntry) -> Optional[str]:
+    """Return the aggregate group of an entry, or None if it isn't in aggregate mode"""
+
+    if not config_entry.options.get("aggregate_mode", False):
+        return None
+    return config_entry.options.get("aggregate_group") or DEFAULT_AGGREGATE_GROUP
+
+def _aggregate_unique_id(group: str) -> str:
+    """Return the unique ID of the aggregate sensor for a group"""
+
+    return f"aggregate_{group}"
+
+def _sensor_unique_id(address: str, sensor_name: str) -> str:
+    """Return the unique ID of the per-bin sensor for an address and bin type"""
+
+    normalized_name = sensor_name if sensor_name.endswith(" Collections") else f"{sensor_name} Collection"
+    return f"{address}_{slugify(normalized_name)}"
+
+@callback
+def _async_remove_stale_entities(hass: HomeAssistant, config_entry: ConfigEntry, unique_ids: Set[str]) -> None:
+    """
+    Remove this entry's sensors that its current mode no longer creates from the entity registry
+
+    Entries switched between per-bin and aggregate mode, or between aggregate groups, would
+    otherwise keep them, restored as unavailable.
+    """
+
+    registry = er.async_get(hass)
+    for entity in er.async_entries_for_config_entry(registry, config_entry.entry_id):
+        if entity.domain == "sensor" and entity.unique_id not in unique_ids:
+            _LOGGER.debug("Removing sensor %s no longer created by this entry", entity.entity_id)
+            registry.async_remove(entity.entity_id)
+
 class BinCollectionSensor(SensorEntity):
     """Sensor representing the bin collection dates for each bin type"""
 
@@ -48,7 +108,7 @@ class BinCollectionSensor(SensorEntity):
         # Normalize the sensor name so that it is user friendly.
         normalized_name = sensor_name if sensor_name.endswith(" Collections") else f"{sensor_name} Collection"
         self._attr_name = normalized_name
-        self._attr_unique_id = f"{coordinator.address}_{slugify(normalized_name)}"
+        self._attr_unique_id = _sensor_unique_id(coordinator.address, sensor_name)
         self._attr_device_class = SensorDeviceClass.TIMESTAMP
         self._attr_state = "unknown"
 
@@ -57,6 +117,16 @@ class BinCollectionSensor(SensorEntity):
 
         self.async_on_remove(self.coordinator.async_add_listener(self.async_write_ha_state))
 
+    @property
+    def available(self) -> bool:
+        """
+        Return whether the sensor is available
+
+        Unavailable until the coordinator has data, e.g. while a staggered first fetch is pending.
+        """
+
+        return bool(self.coordinator.data)
+
     @property
     def state(self) -> str:
         """
@@ -66,10 +136,6 @@ class BinCollectionSensor(SensorEntity):
         If no date is available, returns a default message.
         """
 
-        if not self.coordinator.data:
-            _LOGGER.warning(
-                "Sensor %s could not retrieve data – coordinator data is missing or not updated.", self._sensor_name)
-            return "unavailable" #translation
         dates: List[str] = self.coordinator.data.get(self._sensor_name, [])
         return dates[0] if dates else "No collection scheduled" #translation
 
@@ -97,3 +163,164 @@ class BinCollectionSensor(SensorEntity):
             "manufacturer": DEVICE_MANUFACTURER,
             "model": DEVICE_MODEL,
         }
+
+@callback
+def _async_remove_aggregate_member(hass: HomeAssistant, group: str, config_entry: ConfigEntry) -> None:
+    """
+    Remove an unloaded entry from its aggregate group
+
+    The aggregate sensor belongs to the entry that created it. If that entry is unloaded while
+    other members remain, a replacement sensor is added through the next member's platform.
+    If it was the last member and has left the group, the sensor is removed from the registry.
+    """
+
+    entry_id = config_entry.entry_id
+
+    aggregate_sensors: Dict[str, BinCollectionAggregateSensor] = hass.data.get(AGGREGATE_SENSORS, {})
+    aggregate_sensor = aggregate_sensors.get(group)
+    if aggregate_sensor is None:
+        return
+
+    aggregate_sensor.remove_member(entry_id)
+
+    if entry_id != aggregate_sensor.owner_entry_id:
+        return
+
+    members = aggregate_sensor.pop_members()
+    if not members:
+        aggregate_sensors.pop(group, None)
+
+        # Kept while the entry is only reloading, so registry customisations survive
+        if _aggregate_group(config_entry) != group:
+            registry = er.async_get(hass)
+            entity_id = registry.async_get_entity_id("sensor", DOMAIN, _aggregate_unique_id(group))
+            if entity_id:
+                _LOGGER.debug("Removing aggregate sensor %s left by its last member", entity_id)
+                registry.async_remove(entity_id)
+        return
+
+    new_owner_entry_id = next(iter(members))
+    replacement = aggregate_sensors[group] = BinCollectionAggregateSensor(group, new_owner_entry_id)
+    for member_entry_id, (coordinator, async_add_entities) in members.items():
+        replacement.add_member(member_entry_id, coordinator, async_add_entities)
+
+    members[new_owner_entry_id][1]([replacement])
+    _LOGGER.debug("Aggregate group '%s' moved to entry %s", group, new_owner_entry_id)
+
+class BinCollectionAggregateSensor(SensorEntity):
+    """Sensor summarising the next bin collection dates for every address in an aggregate group"""
+
+    _attr_should_poll = False
+    # Grows with the group and would exceed the recorder's attribute size limit for large groups
+    _unrecorded_attributes = frozenset({"addresses"})
+
+    def __init__(self, group: str, owner_entry_id: str) -> None:
+        """
+        Initialise the sensor
+
+        Args:
+            group (str): The aggregate group, slugified.
+            owner_entry_id (str): The config entry whose platform the sensor is added to.
+        """
+
+        self.owner_entry_id = owner_entry_id
+        self._attr_name = f"{group.replace('_', ' ').title()} Bin Collections"
+        self._attr_unique_id = _aggregate_unique_id(group)
+        self._attr_icon = "mdi:trash-can"
+        self._members: Dict[str, Tuple[BinCollectionDataUpdateCoordinator, Any]] = {}
+        self._unsubscribers: Dict[str, Callable[[], None]] = {}
+        self._summary: Dict[str, Dict[str, str]] = {}
+        self._added = False
+
+    async def async_added_to_hass(self) -> None:
+        """Allow state writes once added"""
+
+        self._added = True
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop state writes once removed, members may still update until moved to a replacement"""
+
+        self._added = False
+
+    def add_member(self, entry_id: str, coordinator: BinCollectionDataUpdateCoordinator, async_add_entities: Any) -> None:
+        """Start following a member coordinator"""
+
+        self._members[entry_id] = (coordinator, async_add_entities)
+        self._unsubscribers[entry_id] = coordinator.async_add_listener(self._handle_member_update)
+        self._handle_member_update()
+
+    def remove_member(self, entry_id: str) -> None:
+        """Stop following a member coordinator"""
+
+        unsubscribe = self._unsubscribers.pop(entry_id, None)
+        if unsubscribe:
+            unsubscribe()
+        self._members.pop(entry_id, None)
+        self._handle_member_update()
+
+    def pop_members(self) -> Dict[str, Tuple[BinCollectionDataUpdateCoordinator, Any]]:
+        """Stop following all members and return them"""
+
+        for unsubscribe in self._unsubscribers.values():
+            unsubscribe()
+        self._unsubscribers.clear()
+
+        members, self._members = self._members, {}
+        return members
+
+    @callback
+    def _handle_member_update(self) -> None:
+        """Rebuild the compact summary and write state only if it changed"""
+
+        summary: Dict[str, Dict[str, str]] = {}
+        for coordinator, _ in self._members.values():
+            # Members without data yet, e.g. awaiting a staggered first fetch, are left out
+            if not coordinator.data:
+                continue
+
+            summary[coordinator.address] = {
+                bin_type: dates[0]
+                for bin_type, dates in coordinator.data.items()
+                if dates
+            }
+
+        if summary == self._summary:
+            return
+
+        self._summary = summary
+        if self._added:
+            self.async_write_ha_state()
+
+    @property
+    def available(self) -> bool:
+        """
+        Return whether the sensor is available
+
+        Unavailable until at least one member has data.
+        """
+
+        return bool(self._summary)
+
+    @property
+    def state(self) -> str:
+        """
+        Return sensor state
+
+        The earliest upcoming collection date across all member addresses.
+        """
+
+        dates = [
+            date
+            for bins in self._summary.values()
+            for date in bins.values()
+            if date != "No collection scheduled"
+        ]
+        return min(dates) if dates else "No collection scheduled" #translation
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """
+        Return the next collection date for each bin type, keyed by address
+        """
+
+        return {"addresses": self._summary}
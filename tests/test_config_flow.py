@@ -0,0 +1,97 @@
+"""Tests for the ABC Council Bin Collection config flow."""
+
+from unittest.mock import patch
+
+import pytest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from homeassistant import config_entries
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.abc_council_bin_collection.const import DOMAIN
+
+from .test_parser import BIN_PAGE
+
+
+class CouncilStandIn:
+    """Local stand-in for the council's bin day page."""
+
+    def __init__(self) -> None:
+        self.fetches: list[str] = []
+        app = web.Application()
+        app.router.add_get("/binday-result/", self._bin_day)
+        self.server = TestServer(app)
+
+    async def _bin_day(self, request: web.Request) -> web.Response:
+        self.fetches.append(request.query["address"])
+        if request.query["address"] == "185000000001":
+            return web.Response(text=BIN_PAGE, content_type="text/html")
+        return web.Response(text="<p>Address not found</p>", content_type="text/html")
+
+
+@pytest.fixture
+async def council(socket_enabled):
+    """Start the council stand-in on localhost and point the integration's URLs at it."""
+
+    stand_in = CouncilStandIn()
+    await stand_in.server.start_server()
+    bin_day_url = str(stand_in.server.make_url("/binday-result/")) + "?address={address}"
+
+    with (
+        patch("custom_components.abc_council_bin_collection.config_flow.BIN_DAY_URL", bin_day_url),
+        patch("custom_components.abc_council_bin_collection.coordinator.BIN_DAY_URL", bin_day_url),
+    ):
+        yield stand_in
+
+    await stand_in.server.close()
+
+
+async def test_user_step_creates_entry(hass: HomeAssistant, council: CouncilStandIn) -> None:
+    """A website address is sanitized to its address value and validated before the entry is created."""
+
+    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": config_entries.SOURCE_USER})
+    assert result["type"] == FlowResultType.FORM
+    assert result["step_id"] == "user"
+
+    with patch("custom_components.abc_council_bin_collection.async_setup_entry", return_value=True):
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {"user_address": "https://www.armaghbanbridgecraigavon.gov.uk/resident/binday-result/?address=185000000001"},
+        )
+        await hass.async_block_till_done()
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert result["data"] == {"address": "185000000001"}
+    assert council.fetches == ["185000000001"]
+
+
+async def test_user_step_errors(hass: HomeAssistant, council: CouncilStandIn) -> None:
+    """Non-numeric addresses and addresses without bins are rejected."""
+
+    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": config_entries.SOURCE_USER})
+
+    result = await hass.config_entries.flow.async_configure(result["flow_id"], {"user_address": "not-an-address"})
+    assert result["errors"] == {"base": "invalid_address"}
+    assert council.fetches == []
+
+    result = await hass.config_entries.flow.async_configure(result["flow_id"], {"user_address": "185000000002"})
+    assert result["errors"] == {"base": "no_bin_sections"}
+
+
+async def test_user_step_data_reused_by_setup(hass: HomeAssistant, council: CouncilStandIn) -> None:
+    """The page fetched to validate the address populates the new entry without fetching it again."""
+
+    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": config_entries.SOURCE_USER})
+    result = await hass.config_entries.flow.async_configure(result["flow_id"], {"user_address": "185000000001"})
+    await hass.async_block_till_done()
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    entry = result["result"]
+    assert entry.state is config_entries.ConfigEntryState.LOADED
+    assert council.fetches == ["185000000001"]
+    assert hass.states.get("sensor.domestic_collections").state == "2026-10-20"
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,85 @@
+"""
+Import time budget for the ABC Council Bin Collection integration.
+
+Runs the integration's imports in a fresh interpreter under ``python -X importtime``
+after pre-loading the Home Assistant modules it depends on (already imported in a
+running instance), so only the integration's own startup cost is measured.
+"""
+
+import subprocess
+import sys
+
+from pathlib import Path
+
+# IMPORT_TIME_BUDGET_MS:
+#   Cumulative import time the integration's modules must stay under. BeautifulSoup
+#   alone takes well over this, so it also catches the parser being imported eagerly.
+IMPORT_TIME_BUDGET_MS: int = 50
+
+MARKER = "--- integration imports ---"
+
+IMPORT_SCRIPT = f"""
+import sys
+import homeassistant.components.button
+import homeassistant.components.sensor
+import homeassistant.config_entries
+import homeassistant.helpers.aiohttp_client
+import homeassistant.helpers.config_validation
+import homeassistant.helpers.entity_platform
+import homeassistant.helpers.entity_registry
+import homeassistant.helpers.event
+import homeassistant.helpers.storage
+import homeassistant.helpers.update_coordinator
+
+sys.stderr.write("{MARKER}\\n")
+sys.stderr.flush()
+
+import custom_components.abc_council_bin_collection
+import custom_components.abc_council_bin_collection.button
+import custom_components.abc_council_bin_collection.config_flow
+import custom_components.abc_council_bin_collection.sensor
+
+print("bs4" in sys.modules)
+"""
+
+
+def _run_import_script() -> tuple[bool, float]:
+    """Return whether bs4 was imported and the integration's import time in milliseconds."""
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_SCRIPT],
+        capture_output=True,
+        check=True,
+        cwd=Path(__file__).parent.parent,
+        text=True,
+    )
+
+    total_us = 0
+    lines = result.stderr.split(MARKER, 1)[1].splitlines()
+    for line in lines:
+        # Lines look like "import time:       221 |        221 |   package.module"
+        if line.startswith("import time:") and "|" in line:
+            self_us = line.split(":", 1)[1].split("|", 1)[0].strip()
+            if self_us.isdigit():
+                total_us += int(self_us)
+
+    return result.stdout.strip() == "True", total_us / 1000
+
+
+def test_bs4_not_imported_at_startup() -> None:
+    """Importing the integration must not load BeautifulSoup."""
+
+    bs4_imported, _ = _run_import_script()
+
+    assert not bs4_imported
+
+
+def test_import_time_within_budget() -> None:
+    """The integration's imports stay under the import time budget."""
+
+    # Best of three to smooth out a cold interpreter cache.
+    import_time_ms = min(_run_import_script()[1] for _ in range(3))
+
+    assert import_time_ms < IMPORT_TIME_BUDGET_MS, (
+        f"Integration import took {import_time_ms:.1f} ms, budget is {IMPORT_TIME_BUDGET_MS} ms"
+    )
@@ -0,0 +1,74 @@
+"""Tests for ABC Council Bin Collection setup and the bulk import service."""
+
+import logging
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
+
+from custom_components.abc_council_bin_collection.const import DOMAIN
+from custom_components.abc_council_bin_collection.coordinator import BinCollectionDataUpdateCoordinator
+
+DATA = {
+    "Domestic Collections": ["2026-10-20", "2026-11-03"],
+    "Recycling Collections": ["2026-10-27"],
+    "Garden/Food Collections": ["No collection scheduled"],
+}
+
+
+async def test_import_addresses_staggers_first_fetch(hass: HomeAssistant) -> None:
+    """Imported addresses are sanitized, deduplicated and given a staggered first fetch delay."""
+
+    assert await async_setup_component(hass, DOMAIN, {})
+
+    with patch("custom_components.abc_council_bin_collection.async_setup_entry", return_value=True):
+        await hass.services.async_call(
+            DOMAIN,
+            "import_addresses",
+            {
+                "addresses": [
+                    "185000000001",
+                    "https://www.armaghbanbridgecraigavon.gov.uk/resident/binday-result/?address=185000000002",
+                    "not-an-address",
+                    "185000000001",
+                ],
+                "stagger_window": 400,
+            },
+            blocking=True,
+        )
+        await hass.async_block_till_done()
+
+    assert [entry.data for entry in hass.config_entries.async_entries(DOMAIN)] == [
+        {"address": "185000000001"},
+        {"address": "185000000002", "first_fetch_delay": 100.0},
+    ]
+
+
+async def test_delayed_first_fetch(hass: HomeAssistant, caplog) -> None:
+    """A delayed entry starts unavailable without warnings, drops its delay and fetches once it elapses."""
+
+    entry = MockConfigEntry(domain=DOMAIN, data={"address": "185000000001", "first_fetch_delay": 60})
+    entry.add_to_hass(hass)
+
+    with patch.object(BinCollectionDataUpdateCoordinator, "_async_update_data", return_value=DATA) as update:
+        caplog.set_level(logging.WARNING)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        assert entry.data == {"address": "185000000001"}
+        update.assert_not_called()
+        assert hass.states.get("sensor.domestic_collections").state == "unavailable"
+        assert not [record for record in caplog.records if record.name.startswith("custom_components")]
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=61))
+        await hass.async_block_till_done()
+
+        update.assert_called_once()
+        assert hass.states.get("sensor.domestic_collections").state == "2026-10-20"
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
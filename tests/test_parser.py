@@ -0,0 +1,87 @@
+"""Tests for the ABC Council Bin Collection batched HTML parser."""
+
+import asyncio
+import time
+
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.abc_council_bin_collection.const import DOMAIN, PARSE_BATCH_SIZE
+from custom_components.abc_council_bin_collection.diagnostics import async_get_config_entry_diagnostics
+from custom_components.abc_council_bin_collection.parser import BinCollectionParser, async_get_parser, parse_bin_html
+
+BIN_PAGE = """
+<div class="row">
+  <div class="col"><div class="heading bg-black">Domestic</div></div>
+  <div class="col-sm-12 col-md-9"><h4>20/10/2026</h4><h4>03/11/2026</h4></div>
+</div>
+<div class="row">
+  <div class="col"><div class="heading bg-green">Recycling</div></div>
+  <div class="col-sm-12 col-md-9"><h4>27/10/2026</h4></div>
+</div>
+"""
+
+
+def test_parse_bin_html() -> None:
+    """Dates are read per bin type, and a page without bin sections parses to nothing."""
+
+    assert parse_bin_html(BIN_PAGE) == {
+        "Domestic Collections": ["2026-10-20", "2026-11-03"],
+        "Recycling Collections": ["2026-10-27"],
+        "Garden/Food Collections": ["No collection scheduled"],
+    }
+    assert parse_bin_html("<p>Address not found</p>") == {}
+
+
+async def test_pages_are_parsed_in_batches(hass: HomeAssistant) -> None:
+    """Pending pages are grouped into batches of at most PARSE_BATCH_SIZE."""
+
+    parser = BinCollectionParser(hass)
+
+    results = await asyncio.gather(*(parser.async_parse(BIN_PAGE) for _ in range(PARSE_BATCH_SIZE * 2 + 5)))
+
+    assert all(result["Recycling Collections"] == ["2026-10-27"] for result in results)
+    assert parser.metrics["batches"] == 3
+    assert parser.metrics["pages_parsed"] == PARSE_BATCH_SIZE * 2 + 5
+    assert parser.metrics["max_queue_depth"] == PARSE_BATCH_SIZE * 2 + 5
+    assert parser.metrics["queue_depth"] == 0
+
+    await parser.async_shutdown()
+
+
+async def test_shutdown_resolves_every_caller(hass: HomeAssistant) -> None:
+    """Shutting down with batches queued in the pool leaves no caller waiting."""
+
+    def _slow_parse(html: str) -> dict:
+        time.sleep(0.2)
+        return {}
+
+    parser = BinCollectionParser(hass)
+
+    with patch("custom_components.abc_council_bin_collection.parser.parse_bin_html", _slow_parse):
+        callers = [hass.async_create_task(parser.async_parse(BIN_PAGE)) for _ in range(PARSE_BATCH_SIZE * 3 + 1)]
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        await parser.async_shutdown()
+        done, pending = await asyncio.wait(callers, timeout=5)
+
+    assert not pending
+    assert all(caller.cancelled() or caller.exception() is None for caller in done)
+    assert parser.metrics["queue_depth"] == 0
+
+
+async def test_diagnostics_include_parser_metrics(hass: HomeAssistant) -> None:
+    """Parser metrics are exposed through the entry diagnostics with the address redacted."""
+
+    entry = MockConfigEntry(domain=DOMAIN, data={"address": "185000000001"})
+    entry.add_to_hass(hass)
+
+    await async_get_parser(hass).async_parse(BIN_PAGE)
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["entry"] == {"address": "**REDACTED**"}
+    assert diagnostics["parser_metrics"]["pages_parsed"] == 1
+    assert diagnostics["parser_metrics"]["queue_depth"] == 0
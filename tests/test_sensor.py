@@ -0,0 +1,189 @@
+"""Tests for the ABC Council Bin Collection sensors, including aggregate mode."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
+
+from custom_components.abc_council_bin_collection.const import DOMAIN
+from custom_components.abc_council_bin_collection.coordinator import BinCollectionDataUpdateCoordinator
+
+from .test_init import DATA
+
+AGGREGATE_OPTIONS = {"aggregate_mode": True, "aggregate_group": "my_street"}
+
+# The recorder drops all attributes of a state whose recorded attributes exceed this many bytes
+MAX_STATE_ATTRS_BYTES = 16384
+
+
+async def _setup_entry(hass: HomeAssistant, address: str, options: dict) -> MockConfigEntry:
+    """Add and set up an entry whose fetch returns DATA."""
+
+    entry = MockConfigEntry(domain=DOMAIN, data={"address": address}, options=options)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    return entry
+
+
+async def test_options_flow_slugifies_aggregate_group(hass: HomeAssistant) -> None:
+    """Group names are stored slugified so near-identical names share a group."""
+
+    entry = MockConfigEntry(domain=DOMAIN, data={"address": "185000000001"})
+    entry.add_to_hass(hass)
+
+    with patch("custom_components.abc_council_bin_collection.async_setup_entry", return_value=True):
+        result = await hass.config_entries.options.async_init(entry.entry_id)
+        await hass.config_entries.options.async_configure(
+            result["flow_id"], {"update_interval": 96, "create_calendar_events": False, "aggregate_mode": True, "aggregate_group": "My Street!"}
+        )
+        await hass.async_block_till_done()
+
+    assert entry.options["aggregate_group"] == "my_street"
+
+
+async def test_aggregate_mode_replaces_per_bin_entities(hass: HomeAssistant) -> None:
+    """Switching an entry to aggregate mode removes its per-bin sensors and button from the registry."""
+
+    registry = er.async_get(hass)
+
+    with patch.object(BinCollectionDataUpdateCoordinator, "_async_update_data", return_value=DATA):
+        entry = await _setup_entry(hass, "185000000001", {})
+        assert len(er.async_entries_for_config_entry(registry, entry.entry_id)) == 4
+
+        hass.config_entries.async_update_entry(entry, options=AGGREGATE_OPTIONS)
+        assert await hass.config_entries.async_reload(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert [entity.unique_id for entity in er.async_entries_for_config_entry(registry, entry.entry_id)] == [
+        "aggregate_my_street"
+    ]
+    assert hass.states.get("sensor.domestic_collections") is None
+    assert hass.states.get("button.clear_bin_events") is None
+
+    state = hass.states.get("sensor.my_street_bin_collections")
+    assert state.state == "2026-10-20"
+    assert state.attributes["addresses"] == {
+        "185000000001": {
+            "Domestic Collections": "2026-10-20",
+            "Recycling Collections": "2026-10-27",
+            "Garden/Food Collections": "No collection scheduled",
+        }
+    }
+
+
+async def test_aggregate_sensor_removed_when_its_only_member_leaves(hass: HomeAssistant) -> None:
+    """An entry's old aggregate sensor is removed when it moves group or leaves aggregate mode, but kept on reload."""
+
+    registry = er.async_get(hass)
+
+    def sensor_unique_ids(entry: MockConfigEntry) -> list[str]:
+        return sorted(
+            entity.unique_id for entity in er.async_entries_for_config_entry(registry, entry.entry_id)
+            if entity.domain == "sensor"
+        )
+
+    with patch.object(BinCollectionDataUpdateCoordinator, "_async_update_data", return_value=DATA):
+        entry = await _setup_entry(hass, "185000000001", AGGREGATE_OPTIONS)
+        registry_id = registry.async_get("sensor.my_street_bin_collections").id
+
+        assert await hass.config_entries.async_reload(entry.entry_id)
+        await hass.async_block_till_done()
+        assert registry.async_get("sensor.my_street_bin_collections").id == registry_id
+
+        hass.config_entries.async_update_entry(entry, options={"aggregate_mode": True, "aggregate_group": "other_street"})
+        assert await hass.config_entries.async_reload(entry.entry_id)
+        await hass.async_block_till_done()
+
+        assert sensor_unique_ids(entry) == ["aggregate_other_street"]
+        assert hass.states.get("sensor.my_street_bin_collections") is None
+        assert hass.states.get("sensor.other_street_bin_collections").state == "2026-10-20"
+
+        hass.config_entries.async_update_entry(entry, options={"aggregate_mode": False, "aggregate_group": "other_street"})
+        assert await hass.config_entries.async_reload(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert sensor_unique_ids(entry) == [
+        "185000000001_domestic_collections",
+        "185000000001_garden_food_collections",
+        "185000000001_recycling_collections",
+    ]
+    assert hass.states.get("sensor.other_street_bin_collections") is None
+    assert hass.states.get("sensor.domestic_collections").state == "2026-10-20"
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_aggregate_group_moves_when_owner_unloads(hass: HomeAssistant) -> None:
+    """Entries in a group share one sensor, which survives the entry that created it being unloaded."""
+
+    with patch.object(BinCollectionDataUpdateCoordinator, "_async_update_data", return_value=DATA):
+        first = await _setup_entry(hass, "185000000001", AGGREGATE_OPTIONS)
+        second = await _setup_entry(hass, "185000000002", AGGREGATE_OPTIONS)
+
+    state = hass.states.get("sensor.my_street_bin_collections")
+    assert set(state.attributes["addresses"]) == {"185000000001", "185000000002"}
+    assert len(hass.states.async_entity_ids("sensor")) == 1
+
+    assert await hass.config_entries.async_unload(first.entry_id)
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.my_street_bin_collections")
+    assert set(state.attributes["addresses"]) == {"185000000002"}
+    assert er.async_get(hass).async_get("sensor.my_street_bin_collections").config_entry_id == second.entry_id
+
+    assert await hass.config_entries.async_unload(second.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_aggregate_unavailable_until_a_member_has_data(hass: HomeAssistant) -> None:
+    """Members awaiting their first fetch are left out instead of reporting no collections."""
+
+    with patch.object(BinCollectionDataUpdateCoordinator, "_async_update_data", return_value=DATA):
+        first = MockConfigEntry(
+            domain=DOMAIN, data={"address": "185000000001", "first_fetch_delay": 60}, options=AGGREGATE_OPTIONS
+        )
+        first.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(first.entry_id)
+        await hass.async_block_till_done()
+
+        assert hass.states.get("sensor.my_street_bin_collections").state == "unavailable"
+
+        second = await _setup_entry(hass, "185000000002", AGGREGATE_OPTIONS)
+
+        state = hass.states.get("sensor.my_street_bin_collections")
+        assert state.state == "2026-10-20"
+        assert set(state.attributes["addresses"]) == {"185000000002"}
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=61))
+        await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.my_street_bin_collections")
+    assert set(state.attributes["addresses"]) == {"185000000001", "185000000002"}
+
+    for entry in (first, second):
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_aggregate_addresses_not_recorded(hass: HomeAssistant) -> None:
+    """A large group's addresses attribute is left out of the recorder instead of exceeding its size limit."""
+
+    with patch.object(BinCollectionDataUpdateCoordinator, "_async_update_data", return_value=DATA):
+        entries = [await _setup_entry(hass, f"1850000{number:05}", AGGREGATE_OPTIONS) for number in range(200)]
+
+    state = hass.states.get("sensor.my_street_bin_collections")
+    assert len(state.attributes["addresses"]) == 200
+    assert len(json_bytes(state.attributes)) > MAX_STATE_ATTRS_BYTES
+
+    assert "addresses" in state.state_info["unrecorded_attributes"]
+
+    for entry in entries:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()